@@ -43,32 +43,60 @@ module tb();
         .rst_n(rst_n)
     );
 
-    // Clock (tiny tapeout default is slow, but simulation can be faster)
-    always #5 clk = ~clk;
+    // ---------- Unit-test probes (driven by test.py) ----------
+    reg [9:0] pix_x_sim;
+    reg [9:0] pix_y_sim;
 
-    initial begin
-        // init
-        clk = 0;
-        rst_n = 0;
-        ena = 1;
-        ui_in = 0;
-        uio_in = 0;
+    // Static top line
+    wire draw_line_sim;
+    static_top_line line_probe (
+        .pix_x(pix_x_sim),
+        .pix_y(pix_y_sim),
+        .draw_line(draw_line_sim)
+    );
 
-        // Come out of reset
-        #40;
-        rst_n = 1;
+    // U shape / player ("UW" letters); the player's letter x positions
+    // are hardwired inside the module, so x_pos_sim only drives the
+    // standalone U_shape probe.
+    reg [9:0] x_pos_sim;
+    reg [9:0] y_pos_sim;
 
-        // ---------- Stimulus examples ----------
-        // Speed control (ui_in[3:0])
-        #100 ui_in[3:0] = 4'd3;
+    wire draw_U_sim;
+    U_shape u_probe (
+        .pix_x(pix_x_sim),
+        .pix_y(pix_y_sim),
+        .x_pos(x_pos_sim),
+        .y_pos(y_pos_sim),
+        .draw_U(draw_U_sim)
+    );
 
-        // Direction (ui_in[4])
-        #200 ui_in[4] = 1;
+    wire draw_player_sim;
+    player player_probe (
+        .pix_x(pix_x_sim),
+        .pix_y(pix_y_sim),
+        .y_pos(y_pos_sim),
+        .show_player(1'b1),
+        .draw_player(draw_player_sim)
+    );
 
-        // Let animation run
-        #20000;
+    // Double sine wave scene
+    reg [9:0] x_offset_sim;
 
-        $finish;
-    end
+    wire draw_double_sin_sim;
+    create_game_scene scene_probe (
+        .pix_x(pix_x_sim),
+        .pix_y(pix_y_sim),
+        .x_offset(x_offset_sim),
+        .draw_sin(draw_double_sin_sim)
+    );
+
+    // Sine LUT
+    reg [3:0] tb_pos_sim;
+
+    wire [7:0] tb_sin_output_sim;
+    sine_lut lut_probe (
+        .pos(tb_pos_sim),
+        .sin_output(tb_sin_output_sim)
+    );
 
 endmodule